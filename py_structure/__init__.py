@@ -11,8 +11,8 @@ It allows to generate static types for objects in both initialization & during e
 
 from .base import StructureMeta, Structure
 from .multi_dispatch import MultiMethodMeta
-from .utilities import flatten, sort_list_by_another
-from .tools import Timer, Counter, Cache, LazyCLass, lazyproperty
+from .utilities import flatten, flatten_numeric, sort_list_by_another
+from .tools import Timer, Counter, Cache, StrongCache, LazyCLass, lazyproperty
 from .protocols import Descriptor, FrozenDescriptor, Validator, FrozenValidator, Singleton
 from .fields import (
     Typed,
@@ -55,63 +55,91 @@ __all__ = [
     # Multiple Dispatch with Function Annotations
     'MultiMethodMeta',
     # Tools
-    'Timer', 'Counter', 'Cache',  'lazyproperty', 'LazyCLass',
+    'Timer', 'Counter', 'Cache', 'StrongCache', 'lazyproperty', 'LazyCLass',
     # Utilities
-    flatten, sort_list_by_another
+    'flatten', 'flatten_numeric', 'sort_list_by_another'
 ]
 
 
 class PositiveInt(Int, Positive):
     """Positive Int Number"""
 
+    __slots__ = ()
+
 
 class NegativeInt(Int, Negative):
     """Negative Int Number"""
 
+    __slots__ = ()
+
 
 class PositiveFloat(Float, Positive):
     """Positive Float Number"""
 
+    __slots__ = ()
+
 
 class NegativeFloat(Float, Negative):
     """Negative Float Number"""
 
+    __slots__ = ()
+
 
 class PositiveDecimal(Decimal, Positive):
     """Positive Decimal Number"""
 
+    __slots__ = ()
+
 
 class NegativeDecimal(Decimal, Negative):
     """Negative Decimal Number"""
 
+    __slots__ = ()
+
 
 class IntRange(Int, Range):
     """Int Range Field"""
 
+    __slots__ = ()
+
 
 class FloatRange(Float, Range):
     """Float Range Field"""
 
+    __slots__ = ()
+
 
 class DecimalRange(Decimal, Range):
     """Decimal Range Field"""
 
+    __slots__ = ()
+
 
 class BinaryRange(Binary, Range):
     """Binary Range Field"""
 
+    __slots__ = ()
+
 
 class HexRange(Hex, Range):
     """Hex Range Field"""
 
+    __slots__ = ()
+
 
 class OctRange(Oct, Range):
     """Oct Range Field"""
 
+    __slots__ = ()
+
 
 class ComplexRange(Complex, Range):
     """Complex Range Field"""
 
+    __slots__ = ()
+
 
 class DurationDateTime(DateTime, Range):
     """Duration DateTime Field"""
+
+    __slots__ = ()
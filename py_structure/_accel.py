@@ -0,0 +1,113 @@
+import sys
+from importlib import import_module
+from typing import Any, Callable, Iterable
+
+# optional dependencies are imported here only, other modules get them from this module on first use,
+# so importing the package never imports numpy nor numba
+_optional_modules = {}
+
+# compiled kernels by name, they are compiled on first call with a numeric array
+_kernels = None
+
+# range of integers that numba could type as a scalar argument of the kernels
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def optional_import(name: str) -> Any:
+    """Import an optional dependency on first use, None in case of it isn't installed"""
+    try:
+        return _optional_modules[name]
+    except KeyError:
+        pass
+    try:
+        module = import_module(name)
+    except ImportError:
+        module = None
+    _optional_modules[name] = module
+    return module
+
+
+def _first_invalid(values: Iterable, condition: Callable[[Any], bool]) -> int:
+    """Get the index of the first value that doesn't satisfy the condition, -1 if all of them do"""
+    for i, value in enumerate(values):
+        if not condition(value):
+            return i
+    return -1
+
+
+# kernels in python, they are compiled with numba on first use, module level functions could be cached by numba
+def _out_of_range_kernel(a, lo, hi):
+    for i in range(a.shape[0]):
+        if not lo < a[i] < hi:
+            return i
+    return -1
+
+
+def _not_positive_kernel(a):
+    for i in range(a.shape[0]):
+        if not a[i] > 0:
+            return i
+    return -1
+
+
+def _not_negative_kernel(a):
+    for i in range(a.shape[0]):
+        if not a[i] < 0:
+            return i
+    return -1
+
+
+def _compile_kernels(njit: Callable) -> dict:
+    """Compile the numeric array kernels with numba"""
+    kernels = {'out_of_range': _out_of_range_kernel, 'not_positive': _not_positive_kernel,
+               'not_negative': _not_negative_kernel}
+    return {name: njit(cache=True)(kernel) for name, kernel in kernels.items()}
+
+
+def _get_kernel(name: str, values: Any) -> Any:
+    """Get the compiled kernel in case of the values could be passed to it - one dimensional numeric numpy array -,
+    None otherwise. numpy arrays only exist in case of numpy is already imported, so it is never imported here
+    """
+    global _kernels
+    np = sys.modules.get('numpy')
+    if np is None or not isinstance(values, np.ndarray) or values.ndim != 1 or values.dtype.kind not in 'iuf':
+        return None
+    if _kernels is None:
+        numba = optional_import('numba')
+        _kernels = {} if numba is None else _compile_kernels(numba.njit)
+    return _kernels.get(name)
+
+
+def _bounds_fit(values: Any, *bounds: Any) -> bool:
+    """Check if the bounds could be passed to the kernels along with the values, without overflowing"""
+    if values.dtype.kind in 'iu':
+        info = sys.modules['numpy'].iinfo(values.dtype)
+        low, high = info.min, info.max
+    else:
+        low, high = _INT64_MIN, _INT64_MAX
+    return all(isinstance(bound, float) or (type(bound) is int and low <= bound <= high) for bound in bounds)
+
+
+def first_out_of_range(values: Iterable, lo: Any, hi: Any) -> int:
+    """Get the index of the first value that is not within the range (lo, hi), -1 if all of them are"""
+    kernel = _get_kernel('out_of_range', values)
+    # bounds that don't fit the array dtype are compared in python instead, the kernel would overflow on them
+    if kernel is not None and _bounds_fit(values, lo, hi):
+        return kernel(values, lo, hi)
+    return _first_invalid(values, lambda value: lo < value < hi)
+
+
+def first_not_positive(values: Iterable) -> int:
+    """Get the index of the first value that is not positive, -1 if all of them are"""
+    kernel = _get_kernel('not_positive', values)
+    if kernel is not None:
+        return kernel(values)
+    return _first_invalid(values, lambda value: value > 0)
+
+
+def first_not_negative(values: Iterable) -> int:
+    """Get the index of the first value that is not negative, -1 if all of them are"""
+    kernel = _get_kernel('not_negative', values)
+    if kernel is not None:
+        return kernel(values)
+    return _first_invalid(values, lambda value: value < 0)
@@ -1,36 +1,93 @@
-from typing import Any, Tuple
-from collections import OrderedDict
-
-from .protocols import Descriptor, FrozenDescriptor
-
-
-def _make_init(fields_names: Tuple[str]) -> str:
-    """Generate code for init function"""
-    # first part of __init__ function
-    code = f"def __init__(self, {', '.join(fields_names)}):\n"
-    # adding fields with the rest of the code
-    for field in fields_names:
-        code += f"   self.{field} = {field}\n"
-    return code
-
-
-def _make_init_with_descriptors(fields: Tuple[Tuple[str, Descriptor]]) -> str:
-    """"Generate code for init function with regarding of none initialized fields"""
-
-    # get required initialized fields in tuple, and none required in dict
-    required_fields = tuple(k for k, v in fields if v.init is True)
-    none_required_fields = {k: v for k, v in fields if v.init is False}
-
-    # generate code with required fields
-    code = _make_init(required_fields)
-
-    # add none required fields to the generated code
-    for name, dec in none_required_fields.items():
-        # get type default class name
-        typ_name = type(dec.default).__name__
-        # concatenating none required field with other code
-        code += f"   self.{name} = {typ_name}('{dec.default}')\n"
-    return code
+from copy import copy
+from types import MemberDescriptorType
+from functools import wraps
+from operator import attrgetter
+from typing import Any, Tuple, Dict, Callable
+
+from .protocols import Descriptor
+from .utilities import _get_slot_name
+
+
+def _build_init(cls: type, required_fields: Tuple[str], default_values: Dict[str, Any]) -> Callable:
+    """Build init function that assigns required fields from arguments and none required fields from defaults"""
+    # the init is generated with the fields as its parameters, so arguments are bound by the interpreter itself,
+    # generated names start with double underscores, fields names never do, so they can't shadow each other
+    namespace = {'__name__': cls.__module__, '__copy': copy, '__defaults_validated': not default_values}
+    lines = [f"def __init__({', '.join(('self', *required_fields))}):"]
+    # required fields go throw descriptors to be validated
+    lines.extend(f"    self.{name} = {name}" for name in required_fields)
+    if default_values:
+        # none required fields are assigned throw descriptors on the first instance, so they are validated against
+        # a real instance, then they are assigned directly to the instance dict or slots, skipping descriptors
+        lines.append("    if __defaults_validated:")
+        descriptor_map = getattr(cls, '__descriptor_map__')
+        slotted = {name for name in default_values if descriptor_map[name]._slot is not None}
+        if len(slotted) != len(default_values):
+            lines.append("        __instance_dict = self.__dict__")
+        for index, (name, value) in enumerate(default_values.items()):
+            default = f'__default_{index}'
+            namespace[default] = value
+            # immutable defaults are shared between instances, mutable ones are copied for each instance
+            if copy(value) is not value:
+                default = f'__copy({default})'
+            if name in slotted:
+                lines.append(f"        self.{_get_slot_name(name)} = {default}")
+            else:
+                lines.append(f"        __instance_dict[{name!r}] = {default}")
+        lines.append("    else:")
+        lines.append("        __validate_defaults(self)")
+
+        def validate_defaults(instance: Any) -> None:
+            for field, field_value in default_values.items():
+                setattr(instance, field, copy(field_value))
+            namespace['__defaults_validated'] = True
+
+        namespace['__validate_defaults'] = validate_defaults
+    # calling __post_init__ function after initialization if it is constructed in the child class
+    lines.append("    if self.__has_post_init__:")
+    lines.append("        self.__post_init__()")
+    exec('\n'.join(lines), namespace)
+
+    __init__ = namespace['__init__']
+    __init__.__qualname__ = f'{cls.__qualname__}.__init__'
+    __init__.__structure_init__ = True
+    return __init__
+
+
+def _extend_init(init: Callable) -> Callable:
+    """Extend init function of classes without fields to invoke __post_init__ after initialization"""
+
+    @wraps(init)
+    def __init__(self, *args, **kwargs) -> None:
+        init(self, *args, **kwargs)
+        # only the most derived init invokes __post_init__, in case of calling parents init through super
+        if self.__has_post_init__ and type(self).__init__ is __init__:
+            self.__post_init__()
+
+    __init__.__structure_init__ = True
+    return __init__
+
+
+def _is_frozen_descriptor(val: Any) -> bool:
+    """Checking whether the give class is frozen descriptor or not"""
+    return getattr(type(val), '_is_frozen', False)
+
+
+def _make_repr_format(fields_names: Tuple[str]) -> str:
+    """Generate format string of class representation arguments, one placeholder per field"""
+    return f"({', '.join('{!r}' for _ in fields_names)})"
+
+
+def _make_fields_getter(fields_names: Tuple[str]) -> Callable:
+    """Generate getter function that returns fields values of an instance as tuple in a single call"""
+    fields_names = tuple(fields_names)
+    if not fields_names:
+        return staticmethod(lambda instance: ())
+    getter = attrgetter(*fields_names)
+    if len(fields_names) == 1:
+        # attrgetter returns the value itself rather than a tuple in case of a single attribute
+        return staticmethod(lambda instance: (getter(instance),))
+    return staticmethod(getter)
 
 
 class StructureMeta(type):
@@ -38,71 +95,90 @@ class StructureMeta(type):
 
     descriptor: Descriptor = Descriptor
 
-    @classmethod
-    def __prepare__(mcs, name: str, bases: tuple) -> dict:
-        """Actual dictionary that stores class variables"""
-        # OrderedDict is used rather than the regular Dict, cause it is indexed one.
-        return OrderedDict()
+    is_frozen_descriptor = staticmethod(_is_frozen_descriptor)
 
     @classmethod
     def is_descriptor(mcs, val) -> bool:
-        """Checking whether the give class is descriptor or not"""
-        return isinstance(val, mcs.descriptor) or issubclass(type(val), mcs.descriptor)
-
-    @classmethod
-    def is_structure(mcs, val) -> bool:
-        """Checking whether the give class is structure or not"""
-        return isinstance(val, mcs) or issubclass(val, mcs)
-
-    @classmethod
-    def is_frozen_descriptor(mcs, val) -> bool:
-        """Checking whether the give class is frozen descriptor or not"""
-        return FrozenDescriptor in type(val).__mro__
-
-    def __call__(cls, *args, **kwargs):
-        obj = type.__call__(cls, *args, **kwargs)
-        if hasattr(obj, '__post_init__'):
-            # calling __post_init__ function after initialization if it is constructed in the child class
-            post_init = getattr(obj, '__post_init__')
-            post_init.__call__()
-        return obj
+        """Checking whether the give value is descriptor of the meta descriptor class or not"""
+        return isinstance(val, mcs.descriptor)
 
     def __new__(mcs, name: str, bases: tuple, namespace: dict) -> Any:
         # init method need to be supported ###################################
         """Handling the creation of the base structure"""
         # get descriptors name and class as pair (name, descriptor) from parent classes
-        # get name space of parent classes in case of being structure
-        bases_namespace = [vars(base).items() for base in bases if mcs.is_structure(base)]
-        # filtering name spaces to get only descriptors
-        bases_descriptors = [{k: v for k, v in base if mcs.is_descriptor(v)} for base in bases_namespace]
-        # checking whether the len of bases_descriptors is zero or not
-        total_namespace = bases_descriptors[0] if bases_descriptors else {}
-        # update total namespaces with current namespace
-        total_namespace.update(namespace.items())
+        # every structure class caches its own descriptors in __descriptor_map__, so bases are not re-scanned,
+        # bases are merged in reversed order to let the first base take precedence as the mro does
+        total_namespace = {}
+        for base in reversed(bases):
+            total_namespace.update(getattr(base, '__descriptor_map__', ()))
+        # update total namespaces with current namespace, regular dict keeps the definition order of fields
+        total_namespace.update(namespace)
         # assigning total namespace to name space
         namespace = total_namespace
 
+        # get descriptor names only as strings, and descriptor classes only in a single pass
+        # the descriptor flag filters out the rest of attributes, before checking them against the meta descriptor
+        is_descriptor = mcs.is_descriptor
+        fields, descriptors = [], []
+        for key, val in namespace.items():
+            # dunder names are special attributes & methods, not fields
+            if key.startswith('__'):
+                continue
+            if getattr(type(val), '_is_descriptor', False) and is_descriptor(val):
+                fields.append(key)
+                descriptors.append(val)
+        fields, descriptors = tuple(fields), tuple(descriptors)
         # get descriptor name and class as pair (name, descriptor class) for current class
-        items = tuple(filter(lambda pair: mcs.is_descriptor(pair[1]), namespace.items()))
-        # get descriptor classes only
-        descriptors = tuple(descriptor for _, descriptor in items)
-        # get descriptor names only as strings
-        fields = tuple(_name for _name, _ in items)
-        if fields:
-            # initialize class with fields - descriptors` names -
-            exec(_make_init_with_descriptors(items), globals(), namespace)
-
-        for name in fields:
+        items = tuple(zip(fields, descriptors))
+        # get required initialized fields in tuple, and default values of none required ones in dict,
+        # defaults are stored as they are, the init copies mutable ones for each instance
+        required_fields = tuple(k for k, v in items if v.init is True)
+        default_values = {k: v.default for k, v in items if v.init is False}
+        namespace['__default_values__'] = default_values
+        if not fields and '__init__' in namespace:
+            namespace['__init__'] = _extend_init(namespace['__init__'])
+
+        # __post_init__ of the root structure does nothing, so it is only invoked when a child class constructs it
+        has_post_init = any(getattr(base, '__has_post_init__', False) for base in bases)
+        namespace['__has_post_init__'] = has_post_init or (bool(bases) and '__post_init__' in namespace)
+
+        if namespace.get('__use_slots__', any(getattr(base, '__use_slots__', False) for base in bases)):
+            # slotted structures store fields values in slots rather than instance dict,
+            # fields of parent classes already have their own slots
+            bases_fields = set().union(*(getattr(base, '__descriptor_map__', ()) for base in bases))
+            slots = tuple(_get_slot_name(field) for field in fields if field not in bases_fields)
+            namespace.setdefault('__slots__', slots)
+
+        for field, descriptor in items:
             # setting the attribute name of descriptor to corresponding name in parent class, for example:
             # Class NewStructure(Structure):
             #   field = Descriptor()
             # so, we are setting "Descriptor.name = field"
-            setattr(namespace.get(name), 'name', name)
+            descriptor.name = field
 
         cls = super().__new__(mcs, name, bases, namespace)
+        setattr(cls, '__descriptor_map__', dict(items))
         setattr(cls, 'fields', fields)
+        setattr(cls, '__repr_format__', _make_repr_format(fields))
+        setattr(cls, '__field_getter__', _make_fields_getter(fields))
         setattr(cls, '__descriptors', descriptors)
+        # fields & descriptors don't change after class creation, so their combinations are computed once
+        setattr(cls, '__fields_with_descriptors__', items)
+        setattr(cls, '__frozen_fields__', tuple(d for d in descriptors if _is_frozen_descriptor(d)))
         setattr(cls, '__is_initialized', True)
+        for field, descriptor in items:
+            # descriptors of fields with their own slot in this class store values in it directly,
+            # so the storage is picked once here rather than on every access
+            slot = cls.__dict__.get(_get_slot_name(field))
+            if type(slot) is MemberDescriptorType:
+                descriptor._slot = slot
+        if fields:
+            # initialize class with fields - descriptors` names -, the storage of their values is known by now
+            cls.__init__ = _build_init(cls, required_fields, default_values)
+        elif cls.__has_post_init__ and not getattr(cls.__init__, '__structure_init__', False):
+            # classes without fields nor init of their own inherit the init of the next class in the mro,
+            # - a mixin or object - which is extended as well, so they invoke __post_init__ too
+            cls.__init__ = _extend_init(cls.__init__)
         return cls
 
 
@@ -121,13 +197,25 @@ class Structure(metaclass=StructureMeta):
         employee = Employee("employee@gmail.com", "http://google.com")
 
         print(a.get_fields_name())  # names of all fields
+        print(a.get_values())  # values of all fields
         print(a.get_all_fields())  # descriptor of all fields
         print(a.get_all_fields_name())  # name & descriptor zipped together
         print(a.get_frozen_fields())  # frozen fields as descriptor
+
+    Setting "__use_slots__ = True" in the class body stores fields values in slots instead of instance dict,
+    which reduces the memory of each instance. The flag is inherited by child classes.
     """
 
     fields: Tuple[str]
     __descriptors = Tuple[Descriptor]
+    __fields_with_descriptors__: Tuple[Tuple[str, Descriptor]]
+    __frozen_fields__: Tuple[Descriptor]
+    __repr_format__: str
+    __field_getter__: Callable
+    __default_values__: Dict[str, Any]
+    # instances dict is kept for child classes, unless they set __use_slots__ to True
+    __slots__ = ()
+    __use_slots__ = False
 
     def __post_init__(self) -> None:
         """Function runs after the initialization of the class to deliver custom behavior"""
@@ -135,8 +223,13 @@ class Structure(metaclass=StructureMeta):
 
     def __repr__(self) -> str:
         """Structure class representation"""
-        args = ', '.join(repr(getattr(self, name)) for name in self.fields)
-        return f'{self.__class__.__name__}({args})'
+        # format string is generated once per class, so only fields values are formatted in each call
+        args = self.__repr_format__.format(*type(self).__field_getter__(self))
+        return f'{self.__class__.__name__}{args}'
+
+    def get_values(self) -> Tuple[Any]:
+        """Get fields values"""
+        return type(self).__field_getter__(self)
 
     def get_fields_name(self) -> Tuple[str]:
         """Get fields names, variables names of descriptors"""
@@ -148,11 +241,15 @@ class Structure(metaclass=StructureMeta):
 
     def get_all_fields_name(self) -> Tuple[Tuple[str, Descriptor]]:
         """Get fields name with corresponding descriptors class"""
-        return tuple(zip(self.get_fields_name(), self.get_all_fields()))
+        return type(self).__fields_with_descriptors__
 
     def get_frozen_fields(self) -> Tuple[Descriptor]:
         """Get frozen fields"""
-        return tuple(filter(self.is_frozen_descriptor, self.get_all_fields()))
+        return type(self).__frozen_fields__
 
-    is_descriptor = StructureMeta.is_descriptor
-    is_frozen_descriptor = StructureMeta.is_frozen_descriptor
+    is_frozen_descriptor = staticmethod(_is_frozen_descriptor)
+
+    @classmethod
+    def is_descriptor(cls, val) -> bool:
+        """Checking whether the give value is descriptor of the structure or not"""
+        return type(cls).is_descriptor(val)
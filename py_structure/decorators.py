@@ -12,14 +12,19 @@ def timer(func: Callable = None, prefix: str = None, model: BaseMode = PrintMode
     if func is None:
         return partial(timer, prefix=prefix, model=model, run_model=run_model)
 
+    # binding the clock & function name locally to avoid attributes lookup on every call
+    _perf_counter = time.perf_counter_ns
+    _name = func.__name__
+    # mode instance is created once per decorated function, rather than on every call
+    mode = model.__call__() if run_model else None
+
     @wraps(func)
     def wrap_func(*args, **kwargs):
-        t1 = time.perf_counter()
+        t1 = _perf_counter()
         result = func(*args, **kwargs)
-        t2 = time.process_time()
+        elapsed = _perf_counter() - t1
         if run_model:
-            mod = model.__call__()
-            mod.case_info(msg=f'{prefix} Function {func.__name__}\t Executed in {(t2 - t1):.4f}s')
+            mode.case_info(msg=f'{prefix} Function {_name}\t Executed in {elapsed / 1e9:.4f}s')
         return result
     return wrap_func
 
@@ -30,17 +35,20 @@ def debug(func: Callable = None, *, prefix: str = '',  model: BaseMode = PrintMo
     if func is None:
         return partial(debug, prefix=prefix, model=model, run_model=run_model)
 
+    # binding function name locally to avoid attribute lookup on every call
+    _name = func.__name__
+    # mode instance is created once per decorated function, rather than on every call
+    mode = model.__call__() if run_model else None
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
             result = func(*args, **kwargs)
             if run_model:
-                mode = model.__call__()
-                mode.case_info(f'{prefix} Function {func.__name__} \t Invoked Successfully')
+                mode.case_info(f'{prefix} Function {_name} \t Invoked Successfully')
         except Exception as e:
             if run_model:
-                mode = model.__call__()
-                mode.case_info(f'{prefix} Function {func.__name__} \t Invoked Unsuccessfully  \t Error: {e}')
+                mode.case_info(f'{prefix} Function {_name} \t Invoked Unsuccessfully  \t Error: {e}')
         else:
             return result
     return wrapper
@@ -53,11 +61,14 @@ def decorate_func(main_func: Callable = None, decorated_fuc=None, model: BaseMod
     if main_func is None:
         return partial(timer, decorated_fuc=decorated_fuc, model=model, run_model=run_model)
 
+    # mode instance is created once per decorated function, rather than twice on every call
+    mode = model()
+
     @wraps(decorated_fuc)
     def wrap_func(*args, **kwargs):
-        model().case_info(f'Function {main_func.__name__} \t is currently invoked')
+        mode.case_info(f'Function {main_func.__name__} \t is currently invoked')
         result = main_func(*args, **kwargs)
-        model().case_info(f'Function {decorated_fuc.__name__} \t is currently invoked')
+        mode.case_info(f'Function {decorated_fuc.__name__} \t is currently invoked')
         decorated_fuc()
         return result
     return wrap_func
@@ -69,8 +80,18 @@ def decorate_cls(cls: Type = None, func: Callable = debug, model: BaseMode = Pri
 
     if cls is None:
         return partial(decorate_cls, func=func, *args, **kwargs)
-    for name, method in _get_cls_methods(cls):
-        setattr(cls, name, func(method, model=model, run_model=run_model, *args, **kwargs))
+
+    # methods names are scanned once, then reused when other decorators are stacked on the same class
+    names = cls.__dict__.get('__py_structure_methods_cache__')
+    if names is None:
+        # inherited methods are included, staticmethod & classmethod objects are not functions so they are excluded
+        names = tuple(name for name, _ in _get_cls_methods(cls))
+        setattr(cls, '__py_structure_methods_cache__', names)
+
+    # getting methods from class, to decorate the latest version of them
+    _getattr, _setattr = getattr, setattr
+    for name in names:
+        _setattr(cls, name, func(_getattr(cls, name), model=model, run_model=run_model, *args, **kwargs))
     return cls
 
 
@@ -100,16 +121,18 @@ def static_type(func:  Callable = None, model: BaseMode = PrintMode, run_model:
     if func is None:
         return partial(static_type, model=model, run_model=run_model)
 
+    # annotations are taken once at decoration time, rather than on every call
+    annotations = dict(getattr(func, '__annotations__'))
+    annotations_items = tuple(annotations.items())
+    _type = type
+
     @wraps(func)
     def wrapper(**kwargs):
-        annotations = getattr(func, '__annotations__')
-
         if annotations.keys() != kwargs.keys():
             raise ValueError("Annotations and kwargs should be same length")
 
-        for k, v in kwargs.items():
-            ann_typ = annotations.get(k)
-            if ann_typ is not type(v):
+        for k, ann_typ in annotations_items:
+            if _type(kwargs[k]) is not ann_typ:
                 raise ValueError(f"{k} type is not same as its annotation, should be {ann_typ}")
 
         return func(**kwargs)
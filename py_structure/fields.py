@@ -3,22 +3,34 @@ import inspect
 from datetime import datetime
 from functools import partial
 from decimal import Decimal as Dec
-from collections import OrderedDict
 from abc import ABC, abstractmethod
-from typing import Any, Tuple, Pattern
+from typing import Any, Tuple, Pattern, Union, Sequence
 
 # from .decorators import debug
-from .base import Structure
+from .base import Structure, _make_repr_format, _make_fields_getter
 from .protocols import Descriptor
-from .utilities import _get_all_cls_init_args, _get_cls_init_args, _is_default_init
+from ._accel import _first_invalid, first_out_of_range, first_not_positive, first_not_negative
+from .utilities import _get_cls_init_args, _is_default_init
 
 # need to be modified
 from .decorators import debug
 from .modes import NoneMode
 
 
-class Typed(ABC, Descriptor):
+# patterns are compiled once at import instead of per descriptor instance
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_URL_PATTERN = re.compile(r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]+|\(([^\s()<>]+|(\([^\s()<>]+\)))*\))+(?:\(([^\s()<>]+|(\([^\s()<>]+\)))*\)|[^\s`!()\[\]{};:'\".,<>?«»“”‘’]))")
+_SLUG_PATTERN = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+
+
+def _pattern_required(value: Any) -> None:
+    """Matcher of regex fields created without a pattern, setting any value fails"""
+    raise ValueError('pattern is required')
+
+
+class Typed(Descriptor):
     """Base class for type assertion, ensure that value has type/structure as required."""
+    __slots__ = ()
     typ: type = type
 
     def get_type(self) -> type:
@@ -31,76 +43,106 @@ class Typed(ABC, Descriptor):
         return f"Invalid value of {self.name}"
 
     def __set__(self, instance, value) -> Any:
-        if not isinstance(value, self.typ):
+        # values are mostly of the exact type, so the identity check saves the isinstance call for them
+        typ = self.typ
+        if type(value) is not typ and not isinstance(value, typ):
             raise TypeError(self.get_type_error_message())
         super(Typed, self).__set__(instance, value)
 
 
 class Int(Typed):
     """Integer Number Field"""
+    __slots__ = ()
     typ = int
 
 
 class Float(Typed):
     """Float Number Field"""
+    __slots__ = ()
     typ = float
 
 
 class Decimal(Typed):
     """Decimal Number Field"""
+    __slots__ = ()
     typ = Dec
 
 
 class Binary(Typed):
     """Binary Number Field"""
+    __slots__ = ()
     typ = bin
 
 
 class Hex(Typed):
     """Hexadecimal Number Field"""
+    __slots__ = ()
     typ = hex
 
 
 class Oct(Typed):
     """Octal Number Field"""
+    __slots__ = ()
     typ = oct
 
 
 class Complex(Typed):
     """Complex Number Field"""
+    __slots__ = ()
     typ = complex
 
 
 class Signed(ABC, Descriptor):
     """Base class for sign number assertion, ensure that number has a sign as required."""
 
+    __slots__ = ()
+
     @abstractmethod
     def condition(self, value: Any) -> bool:
         """Checking the sign of value """
         pass
 
     def get_value_error_message(self) -> str:
-        return f"Value of {self.name} should be {self.__name__.lower()}"
+        return f"Value of {self.name} should be {type(self).__name__.lower()}"
 
     def __set__(self, instance, value) -> None:
         if not self.condition(value):
             raise ValueError(self.get_value_error_message())
         super(Signed, self).__set__(instance, value)
 
+    def first_invalid(self, values: Sequence) -> int:
+        """Get the index of the first value with a wrong sign, -1 if all of them are valid"""
+        return _first_invalid(values, self.condition)
+
+    def validate_many(self, values: Sequence) -> None:
+        """Validate the sign of many values at once, numeric numpy arrays use a numba kernel if it is installed"""
+        if self.first_invalid(values) != -1:
+            raise ValueError(self.get_value_error_message())
+
 
 class Positive(Signed):
     """Positive Number Field"""
 
+    __slots__ = ()
+
     def condition(self, value: Any) -> bool:
         return value > 0
 
+    def first_invalid(self, values: Sequence) -> int:
+        return first_not_positive(values)
+
 
 class Negative(Signed):
     """Negative Number Field"""
 
+    __slots__ = ()
+
     def condition(self, value: Any) -> bool:
         return value < 0
 
+    def first_invalid(self, values: Sequence) -> int:
+        return first_not_negative(values)
+
 
 class Range(Descriptor):
     """Range Field, it works if the limits have __lt__ && __gt__ functions in their implementation"""
@@ -111,12 +153,19 @@ class Range(Descriptor):
         pair = (min_val, max_val)
         self.max_val = max(pair)
         self.min_val = min(pair)
+        self._range_msg_prefix = f"Value should be within range ({self.min_val}, {self.max_val}) not "
 
     def __set__(self, instance, value) -> Any:
-        if not (self.min_val < value < self.max_val):
-            raise ValueError(f"Value should be within range ({self.min_val}, {self.max_val}) not {value}")
+        if not self.min_val < value < self.max_val:
+            raise ValueError(f"{self._range_msg_prefix}{value}")
         super(Range, self).__set__(instance, value)
 
+    def validate_many(self, values: Sequence) -> None:
+        """Validate many values are within range at once, numeric numpy arrays use a numba kernel if it is installed"""
+        index = first_out_of_range(values, self.min_val, self.max_val)
+        if index != -1:
+            raise ValueError(f"{self._range_msg_prefix}{values[index]}")
+
     @property
     def paris(self) -> Tuple[int, int]:
         """Get range limits"""
@@ -125,6 +174,7 @@ class Range(Descriptor):
 
 class String(Typed):
     """String Field"""
+    __slots__ = ()
     typ = str
 
 
@@ -142,50 +192,80 @@ class SizedString(String):
 
 
 class RegexString(String):
-    """Regex Sting Field"""
+    """Regex Sting Field
+
+    Setting a value checks its type and pattern, then stores it through Descriptor directly instead of walking the
+    super chain of String & Typed. In case of a class after RegexString in the mro overrides __set__, the full chain
+    is used instead so its checks still run.
+    """
+
+    _inline_set: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        mro = cls.__mro__
+        chain = mro[mro.index(RegexString) + 1:]
+        cls._inline_set = all('__set__' not in klass.__dict__ for klass in chain if klass not in (Typed, Descriptor))
 
     def get_value_error_message(self) -> str:
         return f"Value of {self.name} does not match the pattern"
 
-    def __init__(self, *args, pattern: Pattern = None, full_match: bool = False, **kwargs):
-        self.pattern = pattern
+    def __init__(self, *args, pattern: Union[str, Pattern] = None, full_match: bool = False, **kwargs):
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
         self.full_match = full_match
+        # bind the matcher once, so setting a value doesn't pick between match and fullmatch each time
+        if self.pattern is None:
+            self._match = _pattern_required
+        else:
+            self._match = self.pattern.fullmatch if full_match else self.pattern.match
 
         super(RegexString, self).__init__(*args, **kwargs)
 
     def __set__(self, instance, value) -> Any:
-        super(RegexString, self).__set__(instance, value)
-        re_method = re.fullmatch if self.full_match else re.match
-        if re_method(self.pattern, value) is None:
+        if self._inline_set:
+            typ = self.typ
+            if type(value) is not typ and not isinstance(value, typ):
+                raise TypeError(self.get_type_error_message())
+            if self._match(value) is None:
+                raise ValueError(self.get_value_error_message())
+            super(Typed, self).__set__(instance, value)
+            return
+        # values of wrong type are left for the type check of the chain
+        if isinstance(value, str) and self._match(value) is None:
             raise ValueError(self.get_value_error_message())
+        super(RegexString, self).__set__(instance, value)
 
 
 class Email(RegexString):
     """Email Field"""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-        super(Email, self).__init__(*args, pattern=pattern, full_match=True, **kwargs)
+        super(Email, self).__init__(*args, pattern=_EMAIL_PATTERN, full_match=True, **kwargs)
 
 
 class URL(RegexString):
     """URL Field"""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        pattern = re.compile(r"(?i)\b((?:https?://|www\d{0,3}[.]|[a-z0-9.\-]+[.][a-z]{2,4}/)(?:[^\s()<>]+|\(([^\s()<>]+|(\([^\s()<>]+\)))*\))+(?:\(([^\s()<>]+|(\([^\s()<>]+\)))*\)|[^\s`!()\[\]{};:'\".,<>?«»“”‘’]))")
-        super(URL, self).__init__(*args, pattern=pattern, full_match=True, **kwargs)
+        super(URL, self).__init__(*args, pattern=_URL_PATTERN, full_match=True, **kwargs)
 
 
 class Slug(RegexString):
     """Slug Field"""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
-        pattern = re.compile(r"^ [a - z0 - 9] + (?:-[a-z0-9]+) *$")
-        super(Slug, self).__init__(*args, pattern=pattern, full_match=True, **kwargs)
+        super(Slug, self).__init__(*args, pattern=_SLUG_PATTERN, full_match=True, **kwargs)
 
 
 class DateTime(Typed):
     """DateTime Field"""
+    __slots__ = ()
     typ = datetime
 
 
@@ -240,17 +320,16 @@ def typeassert(cls=None, **fields):
 
     # iterate throw kwargs to set teh name an attr and descriptor to its value
     # similar to:  self.name = Descriptor()
-    descriptors_fields = OrderedDict()
+    descriptors_fields = {}
     for name, val in fields.items():
-        # get init args from child cls and its parent
-        cls_parents_args = list(_get_all_cls_init_args(val))  # child args
-        cls_args = list(_get_cls_init_args(val))  # parent args
-        cls_args.extend(cls_parents_args)  # concatenating both of them
+        # get init args of the descriptor instance, classes are initialized without them
+        cls_args = _get_cls_init_args(type(val)) if not isinstance(val, type) else ()
 
-        # get value of init args
-        init_values = {arg: getattr(val, arg, None) for arg in cls_args}
-        # filter args in case of its value was none
-        init_filtered_values = {k: v for k, v in init_values.items() if v is not None}
+        # get value of init args, filtering args in case of its value was none
+        init_filtered_values = {}
+        if cls_args:
+            init_values = {arg: getattr(val, arg, None) for arg in cls_args}
+            init_filtered_values = {k: v for k, v in init_values.items() if v is not None}
 
         # checking if the value is descriptor
         if issubclass(type(val), Descriptor) or issubclass(val, Descriptor):
@@ -260,36 +339,47 @@ def typeassert(cls=None, **fields):
             else:
                 # initialize descriptor class with name attribute only
                 val = val(name=name)
-            descriptors_fields.update({name: val})
+            descriptors_fields[name] = val
         # checking if the value is typed as type - built in types -
         elif isinstance(val, type):
             # creating a class of Typed descriptor with setting its typ to val
             typ_cls = type(f"Custom{val.__name__.capitalize()}", (Typed, ), {'typ': val})
             val = typ_cls(name=name)
-            descriptors_fields.update({name: val})
+            descriptors_fields[name] = val
 
         # setting the value to main class
         setattr(cls, name, val)
 
+    # field names are resolved once, so each call is a single pass over them
+    fields_names = tuple(descriptors_fields)
+    fields_set = frozenset(fields_names)
+    fields_count = len(fields_names)
+
     # setting fields and descriptors
-    setattr(cls, 'fields', descriptors_fields.keys())
-    setattr(cls, '__descriptors', descriptors_fields.values())
+    setattr(cls, 'fields', fields_names)
+    setattr(cls, '__descriptors', tuple(descriptors_fields.values()))
+    setattr(cls, '__repr_format__', _make_repr_format(fields_names))
+    setattr(cls, '__field_getter__', _make_fields_getter(fields_names))
 
     # auto __init__ func generator
     def auto_init(self, *args, **kwargs) -> None:
-        # checking the length of key arguments
-        len_diff = len(kwargs) - len(descriptors_fields)
-        if len_diff < 0:
-            raise TypeError(f'Not enough key arguments, needs at least {abs(len_diff)} key arguments')
-
-        # checking if all descriptors values is passed
-        if any(map(lambda i: i not in kwargs, descriptors_fields.keys())):
-            raise ValueError('Invalid arguments, some of them are not passed')
+        # checking that all descriptors are passed first, so errors raised by descriptors themselves are not hidden
+        if not kwargs.keys() >= fields_set:
+            # naming all descriptors that are not passed, only computed in case of failure
+            missing = fields_set.difference(kwargs)
+            names = ', '.join(nm for nm in fields_names if nm in missing)
+            raise ValueError(f'Invalid arguments, missing fields: {names}')
 
         # assigning values for descriptor attributes
         # similar to: self.name = val
-        for nm, vl in kwargs.items():
-            setattr(self, nm, vl)
+        for nm in fields_names:
+            setattr(self, nm, kwargs[nm])
+
+        # assigning the rest of key arguments as normal attributes
+        if len(kwargs) != fields_count:
+            for nm, vl in kwargs.items():
+                if nm not in fields_set:
+                    setattr(self, nm, vl)
 
         # calling __post_init__ function after __init__
         if hasattr(self, '__post_init__'):
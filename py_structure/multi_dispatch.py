@@ -12,13 +12,16 @@ class MultiMethod:
 
     def __init__(self, name):
         self._methods = {}
+        # the methods dict is only mutated in place, so its lookup can be bound once
+        self._dispatch = self._methods.get
         self.__name__ = name
 
-    def register(self, meth):
-        """Register a new method as a multimethod"""
+    @staticmethod
+    def _parse_signature(meth):
+        """Build a type signature from the method's annotations, with the positions of its defaults"""
         sig = inspect.signature(meth)
-        # Build a type signature from the method's annotations
         _types = []
+        defaults_at = []
         for name, parm in sig.parameters.items():
             if name == 'self':
                 continue
@@ -27,15 +30,29 @@ class MultiMethod:
             if not isinstance(parm.annotation, (type, Descriptor)):
                 raise TypeError('Argument {} annotation must be a type'.format(name))
             if parm.default is not inspect.Parameter.empty:
-                self._methods[tuple(_types)] = meth
+                defaults_at.append(len(_types))
             _types.append(parm.annotation)
-        self._methods[tuple(_types)] = meth
+        return tuple(_types), tuple(defaults_at)
+
+    def register(self, meth):
+        """Register a new method as a multimethod"""
+        sig_types, defaults_at = self._parse_signature(meth)
+        for i in defaults_at:
+            self._methods[sig_types[:i]] = meth
+        self._methods[sig_types] = meth
 
     def __call__(self, *args):
         """Call a method based on type signature of the arguments"""
-        _types = tuple(type(arg) for arg in args[1:])
-        meth = self._methods.get(_types, None)
-        if meth:
+        # build the key directly for the common arities, avoiding a generator per call
+        n = len(args)
+        if n == 2:
+            _types = (type(args[1]),)
+        elif n == 3:
+            _types = (type(args[1]), type(args[2]))
+        else:
+            _types = tuple(type(arg) for arg in args[1:])
+        meth = self._dispatch(_types)
+        if meth is not None:
             return meth(*args)
         else:
             raise TypeError('No matching method for types {}'.format(_types))
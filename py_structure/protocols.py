@@ -6,6 +6,12 @@ from .utilities import _get_cls_init_args
 class Descriptor:
     """Descriptors let objects customize attribute lookup, storage, and deletion."""
 
+    __slots__ = ('name', 'default', 'init', 'metadata', '_slot')
+
+    # flags checked by structures instead of walking the mro with isinstance
+    _is_descriptor: bool = True
+    _is_frozen: bool = False
+
     def __init__(self, name: str = None, default: Any = None, init: bool = True, metadata: dict = None) -> None:
         """Initialization object with value."""
         self.name = name
@@ -16,26 +22,43 @@ class Descriptor:
         self.init = init
         self.default = default
         self.metadata = metadata
+        # slot member that stores the value instead of instance dict, set by slotted structures at class creation
+        self._slot = None
 
     def __get__(self, instance, owner) -> Any:
         """Get object value."""
-        return instance.__dict__.get(self.name)
+        slot = self._slot
+        if slot is None:
+            return instance.__dict__.get(self.name)
+        try:
+            return slot.__get__(instance, owner)
+        except AttributeError:
+            # the slot isn't assigned yet
+            return None
 
     def __set__(self, instance, value) -> None:
         """Set object value."""
         # If the instance class was initialized and init attr is false, then set the value to default
-        is_initialized = getattr(instance, '__is_initialized', False)
-        if not is_initialized and not self.init:
+        # the flag is only looked up for fields with init disabled, others never need it
+        if not self.init and not getattr(type(instance), '__is_initialized', False):
             value = self.default
-        instance.__dict__.update({self.name: value})
+        slot = self._slot
+        if slot is None:
+            instance.__dict__[self.name] = value
+        else:
+            slot.__set__(instance, value)
 
     def __delete__(self, instance) -> None:
         """Delete object value."""
-        del instance.__dict__[self.name]
+        slot = self._slot
+        if slot is None:
+            del instance.__dict__[self.name]
+        else:
+            slot.__delete__(instance)
 
     def __repr__(self) -> str:
         """Descriptor class representation"""
-        args = ', '.join(f"{name}={getattr(self, name, None)}" for name in _get_cls_init_args(self))
+        args = ', '.join(f"{name}={getattr(self, name, None)}" for name in _get_cls_init_args(type(self)))
         return f'{type(self).__name__}({args})'
 
     def get_type_error_message(self) -> str:
@@ -50,6 +73,10 @@ class Descriptor:
 class FrozenDescriptor(Descriptor):
     """Frozen descriptor to freeze the value over execution time"""
 
+    __slots__ = ()
+
+    _is_frozen: bool = True
+
     def __set__(self, instance, value) -> Any:
         """Set a value for object for first time, raise an error if it is already initialized"""
         old_value = self.__get__(instance, instance.__class__)
@@ -74,6 +101,8 @@ class ValidatorMeta(type):
 class Validator(Descriptor, metaclass=ValidatorMeta):
     """Guarantee that child class construct a __set__ method"""
 
+    __slots__ = ()
+
     def __set__(self, instance, value) -> Any:
         super(Validator, self).__set__(instance, value)
 
@@ -81,6 +110,8 @@ class Validator(Descriptor, metaclass=ValidatorMeta):
 class FrozenValidator(FrozenDescriptor, metaclass=ValidatorMeta):
     """Guarantee that child class construct a __set__ method"""
 
+    __slots__ = ()
+
     def __set__(self, instance, value) -> Any:
         super(FrozenValidator, self).__set__(instance, value)
 
@@ -92,25 +123,33 @@ class Singleton(type):
         cls.__instance = None
         super().__init__(*args, **kwargs)
         # call the post init if it is existed
-        if hasattr(cls, '__post_init__'):
-            cls.__post_init__(cls)
+        post_init = getattr(cls, '__post_init__', None)
+        if post_init is not None:
+            post_init(cls)
 
     def __call__(cls, *args, **kwargs):
         # in case of the instance is not none, return the same instance without creating new one
-        if cls.__instance is not None:
-            return cls.__instance
+        instance = cls.__instance
+        if instance is not None:
+            return instance
         # in case the instance is none, create new one then return it
-        cls.__instance = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls.__instance
+        instance = cls.__instance = super(Singleton, cls).__call__(*args, **kwargs)
+        return instance
 
 
 class Proxy:
     """Proxy protocol allows to provide the replacement for an another object.
-    Through using different classes to represent the functionalities of another one."""
+    Through using different classes to represent the functionalities of another one.
+
+    Proxy instances only store the wrapped object, so setting other private attributes - starting with '_' - on them
+    raises an AttributeError, subclasses that need them have an instance dict unless they define __slots__ too.
+    """
+
+    __slots__ = ('_obj',)
 
     def __init__(self, obj):
         """Initialize the class with given object"""
-        self._obj = obj
+        object.__setattr__(self, '_obj', obj)
 
     def __getattr__(self, name):
         """Get a value for a given key name"""
@@ -118,14 +157,14 @@ class Proxy:
 
     def __setattr__(self, name, value):
         """Set a value for a given key name"""
-        if name.startswith('_'):
-            super().__setattr__(name, value)
+        if name[:1] == '_':
+            object.__setattr__(self, name, value)
         else:
             setattr(self._obj, name, value)
 
     def __delattr__(self, name):
         """Delete a value for a given key name"""
-        if name.startswith('_'):
-            super().__delattr__(name)
+        if name[:1] == '_':
+            object.__delattr__(self, name)
         else:
             delattr(self._obj, name)
@@ -1,7 +1,9 @@
 import time
 import weakref
 from typing import Any, Callable
+from collections import OrderedDict
 
+from ._accel import optional_import
 from .utilities import _get_cls_methods_to_property
 
 
@@ -33,6 +35,17 @@ class Timer:
         """Total time till the current invoking."""
         return self.elapsed + self._timer() - self._start
 
+    def deadline(self, limit: float) -> Callable[[], bool]:
+        """Get a checker that tells whether the total time is still below the given limit.
+        The end time is computed once and the clock is bound locally, so it is lighter than comparing
+        current_time in hot loops.
+        """
+        if self._start is None:
+            raise RuntimeError('Not started')
+        end = self._start - self.elapsed + limit
+        _timer = self._timer
+        return lambda: _timer() < end
+
     def start(self) -> None:
         """Start the timer"""
         if self.started:
@@ -67,8 +80,18 @@ class Counter:
 
     _count: int = 0
 
-    def __init__(self, func: Callable) -> None:
-        """Initialize the class with a given function / callable objects"""
+    def __init__(self, func: Callable, jit: bool = False) -> None:
+        """Initialize the class with a given function / callable objects.
+        In case of jit is true and numba is installed, the function is compiled in nopython mode,
+        so only numba compatible functions could be used. Otherwise, the function is used as it is.
+        """
+        numba = optional_import('numba') if jit else None
+        if numba is not None:
+            try:
+                func = numba.njit(cache=True, nogil=True)(func)
+            except RuntimeError:
+                # functions defined in a REPL, a notebook or exec have no file to cache the compiled code in
+                func = numba.njit(nogil=True)(func)
         self._func = func
 
     @property
@@ -103,6 +126,10 @@ class Counter:
         """Leaving the context manager """
 
 
+# sentinel for missed cache lookups, since none could be a cached value
+_MISS = object()
+
+
 class Cache(type):
     """Cache returns a cached reference to a previous instance created with the same arguments (if any). """
 
@@ -111,10 +138,42 @@ class Cache(type):
         cls.__cache = weakref.WeakValueDictionary()
 
     def __call__(cls, *args, **kwargs):
-        if args in cls.__cache:
-            return cls.__cache.get(args)
+        obj = cls.__cache.get(args, _MISS)
+        if obj is not _MISS:
+            return obj
+        obj = super().__call__(*args, **kwargs)
+        cls.__cache[args] = obj
+        return obj
+
+
+class StrongCache(type):
+    """StrongCache is similar to Cache, but it holds strong references to the cached instances, the least recently used
+    instance is evicted once the cache is full.
+
+    Usage Example:
+        class Obj(metaclass=StrongCache, maxsize=128):
+            ...
+    """
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict, maxsize: int = 128) -> Any:
+        return super().__new__(mcs, name, bases, namespace)
+
+    def __init__(cls, name: str, bases: tuple, namespace: dict, maxsize: int = 128):
+        super().__init__(name, bases, namespace)
+        cls.__cache = OrderedDict()
+        cls.__maxsize = maxsize
+
+    def __call__(cls, *args, **kwargs):
+        cache = cls.__cache
+        obj = cache.get(args, _MISS)
+        if obj is not _MISS:
+            cache.move_to_end(args)
+            return obj
         obj = super().__call__(*args, **kwargs)
-        cls.__cache.update({args: obj})
+        cache[args] = obj
+        # unbounded in case of max size is none
+        if cls.__maxsize is not None and len(cache) > cls.__maxsize:
+            cache.popitem(last=False)
         return obj
 
 
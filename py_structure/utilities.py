@@ -1,72 +1,180 @@
-from functools import reduce
-from collections import Iterable
-from typing import List, Tuple, Type, Any, Callable, Generator
-from inspect import Signature, Parameter, signature, isfunction, ismethod, getmembers
+from __future__ import annotations
 
+from functools import wraps
+from weakref import WeakKeyDictionary
+from types import CodeType, FunctionType, MethodType
+from collections.abc import Iterable, Callable, Generator
+from typing import Any
+from inspect import signature, isfunction, CO_VARARGS, CO_VARKEYWORDS
 
-def _get_cls_method_args(cls, func_name: str) -> Tuple[str]:
-    """Get class function arguments for a given class (Child Only, Parents excluded)"""
-    _signature = signature(getattr(cls, func_name))
-    return tuple(arg.name for arg in _signature.parameters.values())
+from ._accel import optional_import
 
 
-def _get_all_cls_method_args(cls: Type, func_name: str) -> Tuple[str]:
-    """Get all function arguments for a given class (Parents Included)"""
-    if not hasattr(cls, '__mro__'):
-        return ()
-    result = (_get_cls_method_args(cl, func_name) for cl in cls.__mro__)  # getting all __init__ function for parent classes
-    return tuple(set(reduce(lambda z, y: z + y,  result)))  # flatting the result
+# signature of the default init function, computed once to compare init functions against
+_OBJECT_INIT_SIG = signature(object.__init__)
 
+# arguments names that are not part of init arguments
+_INIT_ARGS_SKIP = frozenset(('self', 'args', 'kwargs'))
 
-def _get_cls_init_args(cls: Type) -> Tuple[str]:
-    """Get init function arguments for a given class (Child Only, Parents excluded)"""
-    return tuple(name for name in _get_cls_method_args(cls, "__init__") if name not in ('self', 'args', 'kwargs'))
+# introspection results of classes, weakly keyed so classes could still be garbage collected
+_cls_cache = WeakKeyDictionary()
+
+
+def _cache_by_cls(func: Callable) -> Callable:
+    """Cache results of a function that takes a class - and hashable arguments - in the shared weak cache"""
+    name = func.__name__
 
+    @wraps(func)
+    def wrapper(cls: type, *args) -> Any:
+        key = (name, *args)
+        try:
+            return _cls_cache[cls][key]
+        except KeyError:
+            pass
+        result = func(cls, *args)
+        _cls_cache.setdefault(cls, {})[key] = result
+        return result
 
-def _get_all_cls_init_args(cls: Type) -> Tuple[str]:
-    """Get init function arguments for a given class (Parents Included)"""
-    return _get_all_cls_method_args(cls, '__init__')
+    return wrapper
 
 
-def _make_signature(names: List[str]) -> Signature:
-    """Create a signature with given names"""
-    return Signature(tuple(Parameter(name, Parameter.POSITIONAL_OR_KEYWORD) for name in names))
+def _is_default_init(func: Callable) -> bool:
+    """Check if the given function is default init function - object.__init__ -"""
+    if func is object.__init__:
+        return True
+    try:
+        return signature(func) == _OBJECT_INIT_SIG
+    except (ValueError, TypeError):
+        # signature isn't available for some builtins, or func isn't callable at all
+        return False
 
 
-def _get_cls_methods(cls: type) -> List[Tuple[str, Any]]:
-    """Get all class functions or methods"""
-    return getmembers(cls, lambda i: isfunction(i) or ismethod(i))
+@_cache_by_cls
+def _get_cls_method_args(cls, func_name: str) -> tuple[str, ...]:
+    """Get class function arguments for a given class (Child Only, Parents excluded)"""
+    func = getattr(cls, func_name)
+    # plain functions have their arguments names in the code object, the signature is only built for others
+    if isfunction(func) and '__wrapped__' not in func.__dict__ and '__signature__' not in func.__dict__:
+        return _get_code_args(func.__code__)
+    _signature = signature(func)
+    return tuple(arg.name for arg in _signature.parameters.values())
 
 
-def _get_cls_methods_to_property(cls: type) -> List[Tuple[str, Any]]:
+def _get_code_args(code: CodeType) -> tuple[str, ...]:
+    """Get arguments names of a code object in the same order of its signature parameters"""
+    args_count = code.co_argcount
+    kwonly_count = code.co_kwonlyargcount
+    names = code.co_varnames
+    args = names[:args_count]
+    kwonly_args = names[args_count:args_count + kwonly_count]
+    index = args_count + kwonly_count
+    var_args = var_kwargs = ()
+    if code.co_flags & CO_VARARGS:
+        var_args = names[index:index + 1]
+        index += 1
+    if code.co_flags & CO_VARKEYWORDS:
+        var_kwargs = names[index:index + 1]
+    return args + var_args + kwonly_args + var_kwargs
+
+
+@_cache_by_cls
+def _get_cls_init_args(cls: type) -> tuple[str, ...]:
+    """Get init function arguments for a given class (Child Only, Parents excluded)"""
+    return tuple(name for name in _get_cls_method_args(cls, "__init__") if name not in _INIT_ARGS_SKIP)
+
+
+def _get_cls_methods(cls: type) -> list[tuple[str, Any]]:
+    """Get all class functions or methods (Parents Included)"""
+    methods, seen = [], set()
+    # walking the classes dicts directly, the first class in the mro that defines a name shadows the rest
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        for name, value in klass.__dict__.items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if type(value) is FunctionType or type(value) is MethodType:
+                methods.append((name, value))
+    return methods
+
+
+def _is_self_only_function(func: Any) -> bool:
+    """Check if the given function has only one parameter 'self', reading its code object instead of its signature"""
+    code = getattr(func, '__code__', None)
+    return (
+        code is not None
+        and code.co_argcount == 1
+        and not code.co_kwonlyargcount
+        and not code.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+        and code.co_varnames[0] == 'self'
+    )
+
+
+def _get_cls_methods_to_property(cls: type) -> tuple[tuple[str, Any], ...]:
     """Get all methods that cloud be converted to property"""
-    def filter_methods(method):
-        """Get methods that have only one parameter 'self'"""
-        # exclude in case of not being method / function, or it was '__init__' function
-        if not (isfunction(method) or ismethod(method)) or method.__name__ == '__init__':
-            return False
-        # exclude in case of having more than one parameter, that parameter should be 'self'
-        parameters = signature(method).parameters
-        return len(parameters) == 1 and parameters.get('self', None) is not None
-    return getmembers(cls, filter_methods)
+    methods, seen = [], set()
+    # walking the classes dicts directly, the first class in the mro that defines a name shadows the rest
+    for klass in cls.__mro__:
+        if klass is object:
+            continue
+        for name, method in klass.__dict__.items():
+            if name in seen:
+                continue
+            seen.add(name)
+            # exclude dunder methods - __init__ included -, and methods that have parameters other than 'self'
+            if name[:2] != '__' and isfunction(method) and _is_self_only_function(method):
+                methods.append((name, method))
+    return tuple(methods)
 
 
-def _is_default_init(func: Callable) -> bool:
-    """Check if the given function is default init function - object.__init__ -"""
-    return signature(func) == signature(object.__init__)
+def cache_clear() -> None:
+    """Clear the cached introspection results, useful in case of classes are redefined at runtime"""
+    _cls_cache.clear()
 
 
-def flatten(items: Iterable, ignore_types: Tuple[type] = (str, bytes)) -> Generator:
-    """Flatting nested iterables into a single generator"""
+def _get_slot_name(name: str) -> str:
+    """Get the slot name that stores a field value of slotted structures"""
+    return f'_f_{name}'
 
-    for x in items:
-        if isinstance(x, Iterable) and not isinstance(x, ignore_types):
-            yield from flatten(x)
-        else:
+
+def flatten(items: Iterable, ignore_types: tuple[type, ...] = (str, bytes)) -> Generator:
+    """Flatting nested iterables into a single generator"""
+    # stack of iterators is used instead of recursion, so only one generator frame is active regardless of depth
+    stack = [iter(items)]
+    # items are mostly of few types, so whether a type is flattened is decided once and memoized per call
+    memo = {}
+    push, pop, memo_get, iterable, _isinstance = stack.append, stack.pop, memo.get, Iterable, isinstance
+    while stack:
+        for x in stack[-1]:
+            typ = type(x)
+            is_iter = memo_get(typ)
+            if is_iter is None:
+                is_iter = memo[typ] = not _isinstance(x, ignore_types) and _isinstance(x, iterable)
+            if is_iter:
+                if typ is str and len(x) == 1:
+                    # one character strings iterate to themselves, in case of str is not ignored they are leaves
+                    yield x
+                    continue
+                push(iter(x))
+                break
             yield x
+        else:
+            pop()
+
+
+def flatten_numeric(items: Iterable) -> 'numpy.ndarray':
+    """Flatting nested numeric iterables into a single numpy array, numpy arrays inside are raveled as a whole"""
+    np = optional_import('numpy')
+    if np is None:
+        raise ImportError('numpy is required to flatten numeric iterables')
+    leaves = [np.ravel(x) for x in flatten(items, ignore_types=(str, bytes, np.ndarray))]
+    return np.concatenate(leaves) if leaves else np.array([])
 
 
 def sort_list_by_another(sortable: list, base: list) -> list:
     """Sort list based on another"""
-    sortable.sort(key=dict(zip(sortable, base)).get)
+    # sorting positions by the base values keeps duplicated items of sortable paired with their own base value
+    order = sorted(range(len(sortable)), key=base.__getitem__)
+    sortable[:] = [sortable[i] for i in order]
     return sortable
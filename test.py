@@ -1,5 +1,30 @@
+import gc
+import sys
+import math
+import time
 import unittest
+import weakref
+import subprocess
 import warnings
+import importlib.util
+from functools import wraps
+from unittest import mock
+from datetime import datetime, timedelta
+
+from py_structure import PositiveInt, DurationDateTime, utilities, _accel
+from py_structure.base import StructureMeta, Structure
+from py_structure.fields import (
+    Typed, Int, Float, Positive, Negative, Range,
+    String, SizedString, RegexString, Email, URL, Slug,
+    DateTime, Choice,
+    typeassert
+)
+from py_structure.protocols import Descriptor, FrozenDescriptor, Singleton, Proxy
+from py_structure.tools import Timer, Counter, Cache, StrongCache, lazyproperty, LazyCLass
+from py_structure.multi_dispatch import MultiMethodMeta
+from py_structure.utilities import flatten, flatten_numeric, sort_list_by_another
+from py_structure.modes import LogMode
+from py_structure.decorators import timer_cls, decorate_cls
 
 
 class BaseTest(unittest.TestCase):
@@ -11,12 +36,6 @@ class BaseTest(unittest.TestCase):
 class TestFields(BaseTest):
 
     def test_simple_fields(self):
-        from py_structure.fields import (
-            Int, Float,
-            String,
-            typeassert
-        )
-
         @typeassert(name=String(), identifier=Int(), price=Float())
         class Stock:
             ...
@@ -28,15 +47,23 @@ class TestFields(BaseTest):
             stock.identifier = '12'
             stock.price = 4
 
-    def test_complex_fields(self):
-        from py_structure import PositiveInt
-        from py_structure.fields import (
-            Range,
-            SizedString, Email, URL,
-            Choice,
-            typeassert
-        )
+    def test_typeassert_errors(self):
+        class Lookup(Descriptor):
+            def __set__(self, instance, value):
+                super().__set__(instance, {'a': 1}[value])
+
+        @typeassert(name=String(), code=Lookup())
+        class Item:
+            ...
+
+        self.assertEqual(Item(name='item', code='a').code, 1)
+        with self.assertRaisesRegex(ValueError, 'missing fields: code'):
+            Item(name='item')
+        # errors raised while setting a field are not reported as missing fields
+        with self.assertRaises(KeyError):
+            Item(name='item', code='b')
 
+    def test_complex_fields(self):
         @typeassert(name=str, identifier=SizedString(max_len=5), email=Email(),  url=URL(),
                     salary=Range(min_val=4000, max_val=10000), role=Choice(choices=('manager', 'worker')))
         class Employee:
@@ -58,13 +85,34 @@ class TestFields(BaseTest):
         with self.assertRaises(ValueError):
             student.class_num = -10
 
-    def test_field_range(self):
-        from py_structure.fields import (
-            Int,
-            Range,
-            typeassert
-        )
+    def test_regex_fields(self):
+        @typeassert(slug=Slug(), code=RegexString(pattern=r'[A-Z]{3}', full_match=True))
+        class Article:
+            ...
+
+        article = Article(slug='first-article-1', code='ABC')
 
+        with self.assertRaises(ValueError):
+            article.slug = 'First Article'
+        with self.assertRaises(ValueError):
+            article.code = 'ABCD'
+        with self.assertRaises(TypeError):
+            article.code = 123
+
+        # invalid values are not stored
+        self.assertEqual(article.slug, 'first-article-1')
+        self.assertEqual(article.code, 'ABC')
+
+        @typeassert(code=RegexString)
+        class Draft:
+            ...
+
+        with self.assertRaises(ValueError):
+            Draft(code='ABC')
+        with self.assertRaises(ValueError):
+            RegexString(name='code').__set__(article, 'ABC')
+
+    def test_field_range(self):
         class IntRange(Int, Range):
             ...
 
@@ -77,11 +125,52 @@ class TestFields(BaseTest):
         with self.assertRaises(ValueError):
             student.score = 150
 
-    def test_field_duration_date_time(self):
-        from datetime import datetime, timedelta
-        from py_structure import DurationDateTime
-        from py_structure.fields import typeassert
+    def test_combined_fields(self):
+        class SizedRegex(RegexString, SizedString):
+            ...
+
+        class ChoiceRange(Choice, Range):
+            ...
+
+        class Item(Structure):
+            code = SizedRegex(pattern=r'[A-Z]+', full_match=True, max_len=3)
+            level = ChoiceRange(choices=(1, 2, 3, 10), min_val=0, max_val=5)
+
+        item = Item(code='ABC', level=2)
+
+        with self.assertRaises(ValueError):
+            item.code = 'ABCD'
+        with self.assertRaises(ValueError):
+            item.code = 'abc'
+        with self.assertRaises(ValueError):
+            item.level = 4
+        with self.assertRaises(ValueError):
+            item.level = 10
+
+        self.assertEqual(item.code, 'ABC')
+        self.assertEqual(item.level, 2)
+
+    def test_validate_many(self):
+        Range(min_val=1, max_val=100).validate_many([2, 50, 99])
+        Positive().validate_many([1, 2.5])
+        Negative().validate_many([-1, -2.5])
 
+        with self.assertRaises(ValueError):
+            Range(min_val=1, max_val=100).validate_many([2, 100])
+        with self.assertRaises(ValueError):
+            Positive().validate_many([1, 0])
+        with self.assertRaises(ValueError):
+            Negative().validate_many([-1, 3])
+
+        if importlib.util.find_spec('numpy') is not None:
+            import numpy as np
+            Range(min_val=1, max_val=100).validate_many(np.arange(2, 99))
+            # bounds that don't fit the array dtype are compared in python
+            Range(min_val=-1, max_val=2 ** 70).validate_many(np.arange(3))
+            with self.assertRaises(ValueError):
+                Positive().validate_many(np.array([1, -1]))
+
+    def test_field_duration_date_time(self):
         now = datetime.now()
         end = now + timedelta(hours=2)
 
@@ -95,11 +184,183 @@ class TestFields(BaseTest):
             task.duration = now + timedelta(hours=4)
 
 
+class TestStructure(BaseTest):
+
+    def test_init(self):
+        class Employee(Structure):
+            name = String()
+            salary = Range(min_val=4000, max_val=10000)
+            role = String(init=False, default='worker')
+
+        employee = Employee('employee', salary=5000)
+        self.assertEqual(employee.get_values(), ('employee', 5000, 'worker'))
+        self.assertEqual(Employee(salary=6000, name='other').get_values(), ('other', 6000, 'worker'))
+        self.assertEqual(repr(employee), "Employee('employee', 5000, 'worker')")
+        # fields are the parameters of the generated init, so arguments are bound natively
+        self.assertEqual(Employee.__init__.__code__.co_varnames[:3], ('self', 'name', 'salary'))
+
+        with self.assertRaises(TypeError):
+            Employee('employee')
+        with self.assertRaises(TypeError):
+            Employee('employee', 5000, 'manager')
+        with self.assertRaises(TypeError):
+            Employee('employee', 5000, role='manager')
+        with self.assertRaises(ValueError):
+            Employee('employee', 2000)
+
+    def test_post_init(self):
+        class Point(Structure):
+            x = Int()
+            y = Int()
+
+            def __post_init__(self):
+                self.total = self.x + self.y
+
+        class Counter(Structure):
+            def __init__(self, start):
+                self.count = start
+
+            def __post_init__(self):
+                self.count += 1
+
+        class SubCounter(Counter):
+            def __init__(self, start):
+                super().__init__(start * 10)
+
+        self.assertEqual(Point(1, 2).total, 3)
+        self.assertEqual(Counter(1).count, 2)
+        # __post_init__ is invoked once, even though the parent init is called through super
+        self.assertEqual(SubCounter(1).count, 11)
+
+    def test_mutable_defaults(self):
+        class Basket(Structure):
+            owner = String()
+            items = Descriptor(init=False, default=['apple'])
+
+        first, second = Basket('first'), Basket('second')
+        first.items.append('orange')
+
+        self.assertEqual(first.items, ['apple', 'orange'])
+        self.assertEqual(second.items, ['apple'])
+
+    def test_rebuilt_defaults(self):
+        class Point:
+            def __init__(self, x, y):
+                self.x, self.y = x, y
+
+        first_day = datetime(2020, 1, 1)
+
+        class Event(Structure):
+            name = String()
+            start = DateTime(init=False, default=first_day)
+            origin = Descriptor(init=False, default=Point(0, 0))
+
+        event = Event('event')
+        self.assertEqual(event.start, first_day)
+        self.assertEqual((event.origin.x, event.origin.y), (0, 0))
+
+    def test_slots(self):
+        class Point(Structure):
+            __use_slots__ = True
+            x = Int()
+            y = Int()
+
+        class Point3D(Point):
+            z = Int()
+
+        point = Point3D(1, 2, 3)
+
+        self.assertEqual(Point.__slots__, ('_f_x', '_f_y'))
+        self.assertEqual(Point3D.__slots__, ('_f_z',))
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertEqual(point.get_values(), (1, 2, 3))
+
+        with self.assertRaises(TypeError):
+            point.z = 'z'
+
+        # descriptors are bound to the slot of their class, so values never go throw an instance dict
+        descriptors = Point3D.__descriptor_map__
+        self.assertIs(descriptors['x']._slot, Point.__dict__['_f_x'])
+        self.assertIs(descriptors['z']._slot, Point3D.__dict__['_f_z'])
+        del point.z
+        self.assertIsNone(point.z)
+
+        class Code(Structure):
+            __use_slots__ = True
+            value = FrozenDescriptor()
+            kind = String(init=False, default='short')
+
+        code = Code(1)
+        self.assertEqual(code.get_values(), (1, 'short'))
+        self.assertFalse(hasattr(code, '__dict__'))
+        with self.assertRaises(AttributeError):
+            code.value = 2
+
+    def test_mixin_init(self):
+        class Mixin:
+            def __init__(self, x):
+                self.x = x
+
+        class First(Structure, Mixin):
+            ...
+
+        class Second(Mixin, Structure):
+            def __post_init__(self):
+                self.post_init_called = True
+
+        self.assertEqual(First(5).x, 5)
+
+        second = Second(5)
+        self.assertEqual(second.x, 5)
+        self.assertTrue(second.post_init_called)
+
+    def test_meta_descriptor(self):
+        class TypedMeta(StructureMeta):
+            descriptor = Typed
+
+        class Item(Structure, metaclass=TypedMeta):
+            name = String()
+            role = Choice(choices=('manager', 'worker'))
+
+        self.assertEqual(Item.fields, ('name',))
+        self.assertEqual(Item('item').get_values(), ('item',))
+        self.assertTrue(TypedMeta.is_descriptor(Item.__descriptor_map__['name']))
+        self.assertFalse(TypedMeta.is_descriptor(Choice(choices=())))
+        self.assertFalse(Item.is_descriptor(Choice(choices=())))
+        self.assertTrue(StructureMeta.is_descriptor(Choice(choices=())))
+
+    def test_invalid_defaults(self):
+        class Score(Structure):
+            value = Range(min_val=1, max_val=5, init=False, default=100)
+
+        class Name(Structure):
+            value = String(init=False, default=5)
+
+        with self.assertRaises(ValueError):
+            Score()
+        with self.assertRaises(TypeError):
+            Name()
+
+    def test_cross_field_default(self):
+        class AtMostLimit(Descriptor):
+            def __set__(self, instance, value):
+                if value > instance.limit:
+                    raise ValueError(f'{self.name} should be at most {instance.limit}')
+                super().__set__(instance, value)
+
+        class Quota(Structure):
+            limit = Int()
+            used = AtMostLimit(init=False, default=3)
+
+        with self.assertRaises(ValueError):
+            Quota(1)
+        self.assertEqual(Quota(5).get_values(), (5, 3))
+        self.assertEqual(Quota(10).get_values(), (10, 3))
+
+
 class TestProtocols(BaseTest):
 
     def test_singleton(self):
-        from py_structure.protocols import Singleton
-
         class UniqueObj(metaclass=Singleton):
             def __init__(self, info):
                 self.info = info
@@ -111,8 +372,6 @@ class TestProtocols(BaseTest):
         self.assertEqual(a, b)
 
     def test_proxy(self):
-        from py_structure.protocols import Proxy
-
         class Obj:
             def __init__(self, info):
                 self.info = info
@@ -138,8 +397,6 @@ class TestTools(BaseTest):
         self.countdown = countdown
 
     def test_timer(self):
-        from py_structure.tools import Timer
-
         TIME_BREAK = 0.50000
 
         with Timer() as t:
@@ -150,9 +407,19 @@ class TestTools(BaseTest):
 
         self.assertAlmostEqual(t.elapsed, TIME_BREAK, places=4)
 
-    def test_counter(self):
-        from py_structure.tools import Counter
+    def test_timer_deadline(self):
+        TIME_BREAK = 0.10000
+
+        with Timer() as t:
+            in_time = t.deadline(TIME_BREAK)
+            for _ in self.countdown(100_000_000):
+                if not in_time():
+                    break
 
+        self.assertGreaterEqual(t.elapsed, TIME_BREAK)
+        self.assertFalse(in_time())
+
+    def test_counter(self):
         EXECUTION_COUNT = 100
 
         c1 = Counter(func=self.countdown)
@@ -166,9 +433,22 @@ class TestTools(BaseTest):
 
         self.assertEquals(c1._count, c2._count)
 
-    def test_cache(self):
-        from py_structure.tools import Cache
+    def test_counter_jit(self):
+        namespace = {}
+        # functions defined by exec have no source file, so their compiled code can't be cached
+        exec('def add(a, b):\n    return a + b\n', namespace)
+
+        counter = Counter(namespace['add'], jit=True)
+        self.assertEqual(counter(1, 2), 3)
+        self.assertEqual(counter._count, 1)
 
+        # without numba, the function is used as it is
+        with mock.patch.dict(_accel._optional_modules, {'numba': None}):
+            counter = Counter(namespace['add'], jit=True)
+        self.assertIs(counter.get_func(), namespace['add'])
+        self.assertEqual(counter(1, 2), 3)
+
+    def test_cache(self):
         class CashedObj(metaclass=Cache):
             def __init__(self, name):
                 self.name = name
@@ -181,11 +461,21 @@ class TestTools(BaseTest):
         self.assertNotEqual(obj_1, obj_3)
         self.assertEqual(obj_2, obj_3)
 
-    def test_lazyproperty(self):
-        import math
-        import time
-        from py_structure.tools import lazyproperty
+    def test_strong_cache(self):
+        class CashedObj(metaclass=StrongCache, maxsize=2):
+            def __init__(self, name):
+                self.name = name
+
+        obj_1 = CashedObj('First')
+        obj_2 = CashedObj('Second')
 
+        self.assertIs(obj_1, CashedObj('First'))
+        # 'Second' is the least recently used, so it is evicted first
+        CashedObj('Third')
+        self.assertIs(obj_1, CashedObj('First'))
+        self.assertIsNot(obj_2, CashedObj('Second'))
+
+    def test_lazyproperty(self):
         class Point:
 
             def __init__(self, x, y):
@@ -211,10 +501,6 @@ class TestTools(BaseTest):
         self.assertTrue(middle - start > end - middle)
 
     def test_lazyclass(self):
-        import math
-        import time
-        from py_structure.tools import LazyCLass
-
         class Circle(metaclass=LazyCLass):
 
             def __init__(self, radius):
@@ -240,9 +526,6 @@ class TestTools(BaseTest):
 class TestMultiDispatcher(BaseTest):
 
     def test_dispatcher(self):
-        import time
-        from py_structure.multi_dispatch import MultiMethodMeta
-
         class Date(metaclass=MultiMethodMeta):
 
             def __init__(self, year: int, month: int, day: int):
@@ -267,17 +550,52 @@ class TestMultiDispatcher(BaseTest):
 class TestUtilities(BaseTest):
 
     def test_flatten(self):
-        from py_structure.utilities import flatten
-
         lst = (0, 1, 2, 3, 4, 5)
         nested_lst = (0, (1, 2), (3, (4, 5)))
         flatten_lst = tuple(i for i in flatten(nested_lst))
 
         self.assertEqual(flatten_lst, lst)
 
-    def test_sort_list_by_another(self):
-        from py_structure.utilities import sort_list_by_another
+        # strings are flattened into characters, in case of they are not ignored
+        self.assertEqual(list(flatten(['ab', ('c', ['d'])], ignore_types=())), ['a', 'b', 'c', 'd'])
 
+    @unittest.skipUnless(importlib.util.find_spec('numpy'), 'numpy is not installed')
+    def test_flatten_numeric(self):
+        import numpy as np
+        nested_lst = (0, (1, 2), np.array([[3, 4], [5, 6]]), [7, (8, 9)])
+        flatten_arr = flatten_numeric(nested_lst)
+
+        self.assertEqual(flatten_arr.tolist(), list(range(10)))
+
+    def test_optional_dependencies_are_lazy(self):
+        code = "import sys, py_structure; print('numpy' in sys.modules or 'numba' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_introspection_cache_clear(self):
+        class Obj:
+            def __init__(self, name, info=None):
+                ...
+
+        self.assertEqual(utilities._get_cls_init_args(Obj), ('name', 'info'))
+
+        utilities.cache_clear()
+        self.assertNotIn(Obj, utilities._cls_cache)
+
+    def test_introspection_cache_is_weak(self):
+        class Obj:
+            def __init__(self, name):
+                ...
+
+        self.assertEqual(utilities._get_cls_init_args(Obj), ('name',))
+        self.assertIn(Obj, utilities._cls_cache)
+
+        obj_ref = weakref.ref(Obj)
+        del Obj
+        gc.collect()
+        self.assertIsNone(obj_ref())
+
+    def test_sort_list_by_another(self):
         X = ["a", "b", "c", "d", "e", "f", "g", "h", "i"]
         Sorted_X = ['a', 'd', 'h', 'b', 'c', 'e', 'i', 'f', 'g']
         Y = [0, 1, 1, 0, 1, 2, 2, 0, 1]
@@ -286,13 +604,13 @@ class TestUtilities(BaseTest):
 
         self.assertEqual(X, Sorted_X)
 
+        # duplicated items keep their own position in base
+        self.assertEqual(sort_list_by_another(['a', 'b', 'a'], [2, 1, 0]), ['a', 'b', 'a'])
+
 
 class TestDecorators(BaseTest):
 
     def test_decorators_with_modes(self):
-        from py_structure.modes import LogMode
-        from py_structure.decorators import timer_cls
-
         @timer_cls(model=LogMode)
         class Employee:
 
@@ -311,6 +629,33 @@ class TestDecorators(BaseTest):
         employee.set_name('new name')
         employee.get_name()
 
+    def test_decorate_inherited_methods(self):
+        def mark(method, **kwargs):
+            @wraps(method)
+            def wrapper(*args, **kw):
+                return method(*args, **kw)
+            wrapper.marked = True
+            return wrapper
+
+        class Parent:
+            def f(self):
+                return 'f'
+
+        @decorate_cls(func=mark)
+        class Child(Parent):
+            def g(self):
+                return 'g'
+
+            @staticmethod
+            def h():
+                return 'h'
+
+        self.assertTrue(getattr(Child.f, 'marked', False))
+        self.assertTrue(getattr(Child.g, 'marked', False))
+        self.assertFalse(getattr(Child.h, 'marked', False))
+        self.assertFalse(getattr(Parent.f, 'marked', False))
+        self.assertEqual((Child().f(), Child().g(), Child.h()), ('f', 'g', 'h'))
+
 
 if __name__ == '__main__':
     unittest.main()